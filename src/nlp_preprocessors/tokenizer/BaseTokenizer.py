@@ -1,8 +1,10 @@
 import os
 import joblib
-import hashlib
+import xxhash
 
+from typing import Callable
 from abc import abstractmethod
+from .utilities import word_tokenize
 from .utilities import LocalitySensitiveHashing
 
 
@@ -15,7 +17,11 @@ class BaseTokenizer:
         self.padding_idx = padding_idx
 
     def __call__(self, inputs: list):
-        return [[self.numerize(token) for token in self.tokenize(inp)] for inp in inputs]
+        return [self.process(inp) for inp in inputs]
+
+    def process(self, inp):
+        """ Convert a given input into a sequence of numbers """
+        return [self.numerize(token) for token in self.tokenize(inp)]
 
     @abstractmethod
     def tokenize(self, inp):
@@ -30,37 +36,64 @@ class BaseTokenizer:
 
 class TextTokenizer(BaseTokenizer):
     special_tokens = ["<PAD>", "<CLS>", "<SEP>", "<MASK>", "<UNK>"]
+    cache_size = 65536
 
     def __init__(self, 
                 num_embeddings: int, 
                 padding_idx: int=0,
-                input_word: bool=False):
+                input_word: bool=False,
+                word_tokenizer: Callable=None):
 
         super().__init__(num_embeddings, padding_idx)
         self.input_word = input_word
+        self.word_tokenizer = word_tokenizer if word_tokenizer is not None else word_tokenize
+        self.min_id = padding_idx + len(self.special_tokens)
+
+    def cached(self, cache: dict, key, function: Callable):
+        """ Look up a key in a cache bounded by cache_size, computing it with a given function on a miss """
+        value = cache.get(key)
+        if value is None:
+            if len(cache) >= self.cache_size:
+                cache.clear()
+            value = cache[key] = function(key)
+        return value
 
 
 class HashingBasedTokenizer(TextTokenizer):
+    def __init__(self, 
+                num_embeddings: int, 
+                padding_idx: int=0,
+                input_word: bool=False,
+                word_tokenizer: Callable=None):
+
+        super().__init__(num_embeddings, padding_idx, input_word, word_tokenizer)
+        self.cache = {}
+
     def numerize(self, token: str):
         """ Convert a given token into a number """
-        hash_number = int(hashlib.sha3_224(bytes(token, "utf8")).hexdigest(), 16) % self.num_embeddings
-        hash_number = max(hash_number, self.padding_idx + len(self.special_tokens))
+        return self.cached(self.cache, token, self.hash_token)
+
+    def hash_token(self, token: str):
+        """ Hash a given token into a number outside the special token ids """
+        hash_number = xxhash.xxh3_64_intdigest(token.encode("utf8", "surrogatepass")) % self.num_embeddings
+        hash_number = max(hash_number, self.min_id)
         return hash_number
 
 
-class LocalitySensitiveHashingBasedTokenizer(TextTokenizer):
+class LocalitySensitiveHashingBasedTokenizer(HashingBasedTokenizer):
     def __init__(self, 
                  num_embeddings: int, 
                  padding_idx: int=0,
-                 random_seed: int=0):
+                 random_seed: int=0,
+                 word_tokenizer: Callable=None):
 
-        super().__init__(num_embeddings, padding_idx)
+        super().__init__(num_embeddings, padding_idx, word_tokenizer=word_tokenizer)
         self.lsh = LocalitySensitiveHashing(num_embeddings, random_seed)
 
-    def numerize(self, token: str):
-        """ Convert a given token into a number """
+    def hash_token(self, token: str):
+        """ Hash a given token into a number outside the special token ids """
         hash_number = self.lsh(token) % self.num_embeddings
-        hash_number = max(hash_number, self.padding_idx + len(self.special_tokens))
+        hash_number = max(hash_number, self.min_id)
         return hash_number
 
 
@@ -69,9 +102,10 @@ class CorpusBasedTokenizer(TextTokenizer):
                  local_dir: str="corpus_based_tokenizer",
                  num_embeddings: int=None, 
                  padding_idx: int=0,
-                 input_word: bool=False):
+                 input_word: bool=False,
+                 word_tokenizer: Callable=None):
 
-        super().__init__(num_embeddings, padding_idx, input_word)
+        super().__init__(num_embeddings, padding_idx, input_word, word_tokenizer)
         self.local_dir = local_dir
         self.token2id = None
         self.load()
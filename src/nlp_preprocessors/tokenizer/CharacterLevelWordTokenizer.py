@@ -1,4 +1,4 @@
-from nltk import word_tokenize
+from typing import Callable
 
 from .BaseTokenizer import HashingBasedTokenizer, CorpusBasedTokenizer
 
@@ -6,7 +6,7 @@ from .BaseTokenizer import HashingBasedTokenizer, CorpusBasedTokenizer
 class VocabFreeCharacterLevelWordTokenizer(HashingBasedTokenizer):
     def tokenize(self, string: str):
         """ Convert a given string into a sequence of tokens """
-        words = word_tokenize(string) if not self.input_word else [string]
+        words = self.word_tokenizer(string) if not self.input_word else [string]
         tokens = [list(word) for word in words]
         return tokens
 
@@ -21,13 +21,14 @@ class CharacterLevelWordTokenizer(CorpusBasedTokenizer):
                  local_dir: str="char_tokenizer",
                  num_embeddings: int=None, 
                  padding_idx: int=0,
-                 input_word: bool=False):
+                 input_word: bool=False,
+                 word_tokenizer: Callable=None):
 
-        super().__init__(local_dir, num_embeddings, padding_idx, input_word)
+        super().__init__(local_dir, num_embeddings, padding_idx, input_word, word_tokenizer)
 
     def tokenize(self, string: str):
         """ Convert a given string into a sequence of tokens """
-        words = word_tokenize(string) if not self.input_word else [string]
+        words = self.word_tokenizer(string) if not self.input_word else [string]
         tokens = [list(word) for word in words]
         return tokens
 
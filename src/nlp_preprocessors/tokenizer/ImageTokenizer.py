@@ -1,7 +1,10 @@
 import math
 import numpy as np
 
-from .utilities import array2str
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .utilities import binary2number
+from .utilities import numerize_windows
 from .BaseTokenizer import BaseTokenizer
 
 
@@ -22,15 +25,23 @@ class ImageTokenizer(BaseTokenizer):
         self.padding_value = padding_value
 
         np.random.seed(random_seed)
-        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), window_height * window_width])
+        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), window_height * window_width]).astype(np.float32)
 
     def __call__(self, images: list[np.ndarray]):
-        return [self.numerize(self.tokenize(image)) for image in images]
+        if len(images) == 0:
+            return []
+
+        # Numerize windows of all images in bounded float32 chunks, one block per output row
+        tokens = [self.tokenize(image) for image in images]
+        shapes = [token.shape[:2] for token in tokens]
+        numbers = numerize_windows([row for token in tokens for row in token], lambda windows: self.numerize(windows[np.newaxis])[0])
+        offsets = np.cumsum([height * width for height, width in shapes])[:-1]
+        return [number.reshape(shape) for number, shape in zip(np.split(numbers, offsets), shapes)]
 
     def tokenize(self, image: np.ndarray):
         """
         image: (height, width)
-        return: (output_height, output_width, window_height, window_width)
+        return: (output_height, output_width, window_height, window_width), a read-only strided view
         """
         height, width = image.shape
 
@@ -44,17 +55,8 @@ class ImageTokenizer(BaseTokenizer):
         # Padding
         image = np.pad(image, ((0, height_padding_size), (0, width_padding_size)), "constant", constant_values=self.padding_value)
 
-        # Tokenize
-        tokens = np.empty([output_height, output_width, self.window_height, self.window_width])
-        for i in range(output_height):
-            for j in range(output_width):
-                # Get start and end indices
-                start_y = i * self.stride
-                end_y = start_y + self.window_height
-                start_x = j * self.stride
-                end_x = start_x + self.window_width
-                # Get token
-                tokens[output_height - i - 1, j] = image[start_y:end_y, start_x:end_x]
+        # Tokenize (rows are ordered bottom-up)
+        tokens = sliding_window_view(image, (self.window_height, self.window_width))[::self.stride, ::self.stride][::-1]
         return tokens
 
     def numerize(self, tokens: np.ndarray):
@@ -67,7 +69,8 @@ class ImageTokenizer(BaseTokenizer):
         tokens = tokens.reshape(output_height, output_width, -1)
 
         # (output_height, output_width, log(num_embeddings, 2))
-        binary_vecs = (tokens @ self.random_vecs.T > 0).astype(int)
-        numbers = np.apply_along_axis(lambda x: int(array2str(x), 2) % self.num_embeddings, -1, binary_vecs)
-        numbers = np.maximum(numbers, self.padding_idx + 1)
+        binary_vecs = tokens.astype(np.float32, copy=False) @ self.random_vecs.T > 0
+        numbers = binary2number(binary_vecs)
+        np.remainder(numbers, self.num_embeddings, out=numbers)
+        np.maximum(numbers, self.padding_idx + 1, out=numbers)
         return numbers
\ No newline at end of file
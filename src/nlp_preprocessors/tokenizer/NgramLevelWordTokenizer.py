@@ -1,7 +1,7 @@
-from nltk import word_tokenize
+from typing import Callable
 
-from .utilities import word2ngram
-from .utilities import word2skipngram
+from .utilities import iter_grams
+from .utilities import word2grams
 from .BaseTokenizer import HashingBasedTokenizer
 from .BaseTokenizer import LocalitySensitiveHashingBasedTokenizer
 
@@ -11,23 +11,32 @@ class NgramLevelWordTokenizer(HashingBasedTokenizer):
                  num_embeddings: int, 
                  padding_idx: int=0,
                  ngrams: list=(3, 4, 5, 6),
-                 skipngrams: list=(2, 3)):
+                 skipngrams: list=(2, 3),
+                 word_tokenizer: Callable=None):
         
-        super().__init__(num_embeddings, padding_idx)
+        super().__init__(num_embeddings, padding_idx, word_tokenizer=word_tokenizer)
         self.ngrams = ngrams
         self.skipngrams = skipngrams
+        self.id_cache = {}
+
+    def process(self, string: str):
+        """ Convert a given string into a sequence of numbers """
+        words = self.word_tokenizer(string) if not self.input_word else [string]
+        return [self.word2ids(word) for word in words]
+
+    def word2ids(self, word: str):
+        """ Convert a given word into a list of numbers, caching the result per word """
+        return list(self.cached(self.id_cache, word, self.build_ids))
+
+    def build_ids(self, word: str):
+        """ Convert a given word into a list of numbers, hashing each gram as it is sliced """
+        numerize = super().numerize
+        return [numerize(gram) for gram in iter_grams(word, self.ngrams, self.skipngrams)]
 
     def tokenize(self, string: str):
         """ Convert a given string into a sequence of tokens """
-        words = word_tokenize(string) if not self.input_word else [string]
-        tokens = []
-        for word in words:
-            grams = []
-            for n in self.ngrams:
-                grams.extend(word2ngram(word, n))
-            for n in self.skipngrams:
-                grams.extend(word2skipngram(word, n))
-            tokens.append(grams)
+        words = self.word_tokenizer(string) if not self.input_word else [string]
+        tokens = [word2grams(word, self.ngrams, self.skipngrams) for word in words]
         return tokens
 
     def numerize(self, grams: list[str]):
@@ -42,23 +51,21 @@ class LshNgramLevelWordTokenizer(LocalitySensitiveHashingBasedTokenizer):
                  padding_idx: int=0,
                  random_seed: int=0,
                  ngrams: list=(3, 4, 5, 6),
-                 skipngrams: list=(2, 3)):
+                 skipngrams: list=(2, 3),
+                 word_tokenizer: Callable=None):
         
-        super().__init__(num_embeddings, padding_idx, random_seed)
+        super().__init__(num_embeddings, padding_idx, random_seed, word_tokenizer)
         self.ngrams = ngrams
         self.skipngrams = skipngrams
+        self.gram_cache = {}
 
     def tokenize(self, string: str):
         """ Convert a given string into a sequence of tokens """
-        words = word_tokenize(string) if not self.input_word else [string]
+        words = self.word_tokenizer(string) if not self.input_word else [string]
         tokens = []
         for word in words:
-            grams = []
-            for n in self.ngrams:
-                grams.extend(word2ngram(word, n))
-            for n in self.skipngrams:
-                grams.extend(word2skipngram(word, n))
-            tokens.append(grams)
+            grams = self.cached(self.gram_cache, word, lambda word: word2grams(word, self.ngrams, self.skipngrams))
+            tokens.append(list(grams))
         return tokens
 
     def numerize(self, grams: list[str]):
@@ -2,8 +2,11 @@ import math
 import librosa
 import numpy as np
 
-from .utilities import array2str
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .utilities import binary2number
 from .utilities import shorten_signal
+from .utilities import numerize_windows
 from .BaseTokenizer import BaseTokenizer
 from .ImageTokenizer import ImageTokenizer
 
@@ -27,17 +30,31 @@ class SignalTokenizer(BaseTokenizer):
         self.shorten_offset = shorten_offset
 
         np.random.seed(random_seed)
-        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), window_size])
+        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), window_size]).astype(np.float32)
 
     def __call__(self, signals: list[np.ndarray]):
-        return [self.numerize(self.tokenize(signal)) for signal in signals]
+        if len(signals) == 0:
+            return []
+
+        # Numerize windows of all signals in bounded float32 chunks
+        tokens = [self.tokenize(signal) for signal in signals]
+        numbers = numerize_windows(tokens, self.numerize)
+        offsets = np.cumsum([token.shape[0] for token in tokens])[:-1]
+        return np.split(numbers, offsets)
 
     def tokenize(self, signal: np.ndarray):
         """
         signal: (signal_length, )
-        return: (output_length, window_size)
+        return: (output_length, window_size), a read-only strided view in the signal's dtype
         """
         signal = shorten_signal(signal, threshold=self.shorten_threshold, offset=self.shorten_offset)
+        return self.window(signal)
+
+    def window(self, signal: np.ndarray):
+        """
+        signal: (signal_length, )
+        return: (output_length, window_size), a read-only strided view in the signal's dtype
+        """
         signal_length = signal.shape[0]
 
         # Calculate padding size
@@ -46,7 +63,7 @@ class SignalTokenizer(BaseTokenizer):
         # Padding
         signal = np.pad(signal, (0, padding_size), "constant", constant_values=self.padding_value)
         # Tokenize
-        tokens = np.concatenate([signal[np.newaxis, i * self.stride:i * self.stride + self.window_size] for i in range(output_length)], axis=0)
+        tokens = sliding_window_view(signal, self.window_size)[::self.stride]
         return tokens
 
     def numerize(self, tokens: np.ndarray):
@@ -54,30 +71,21 @@ class SignalTokenizer(BaseTokenizer):
         tokens: (output_length, window_size)
         return: (output_length, )
         """
-        binary_vecs = (tokens @ self.random_vecs.T > 0).astype(int)
-        numbers = [int(array2str(vector), 2) % self.num_embeddings for vector in binary_vecs]
-        numbers = [max(number, self.padding_idx + 1) for number in numbers]
-        return  np.array(numbers)
+        numbers = binary2number(tokens.astype(np.float32, copy=False) @ self.random_vecs.T > 0)
+        np.remainder(numbers, self.num_embeddings, out=numbers)
+        np.maximum(numbers, self.padding_idx + 1, out=numbers)
+        return numbers
 
 
 class SignalDerivativeTokenizer(SignalTokenizer):
     def tokenize(self, signal: np.ndarray):
         """
         signal: (signal_length, )
-        return: (output_length, window_size)
+        return: (output_length, window_size), a read-only strided view in the signal's dtype
         """
         signal = shorten_signal(signal, threshold=self.shorten_threshold, offset=self.shorten_offset)
         signal = signal[1:] - signal[:-1]
-        signal_length = signal.shape[0]
-
-        # Calculate padding size
-        output_length = math.ceil((signal_length - self.window_size) / self.stride + 1)
-        padding_size = (output_length - 1) * self.stride - signal_length + self.window_size
-        # Padding
-        signal = np.pad(signal, (0, padding_size), "constant", constant_values=self.padding_value)
-        # Tokenize
-        tokens = np.concatenate([signal[np.newaxis, i * self.stride:i * self.stride + self.window_size] for i in range(output_length)], axis=0)
-        return tokens
+        return self.window(signal)
 
 
 class SignalSpectrogramTokenizer(ImageTokenizer):
@@ -105,7 +113,7 @@ class SignalSpectrogramTokenizer(ImageTokenizer):
     def tokenize(self, signal: np.ndarray):
         """
         signal: (signal_length, )
-        return: (output_height, output_width, window_height, window_width)
+        return: (output_height, output_width, window_height, window_width), a read-only strided view
         """
         # Convert signal into spectrogram image
         signal = shorten_signal(signal, threshold=self.shorten_threshold, offset=self.shorten_offset)
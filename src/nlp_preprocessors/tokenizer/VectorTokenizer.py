@@ -1,7 +1,7 @@
 import math
 import numpy as np
 
-from .utilities import array2str
+from .utilities import binary2number
 from .BaseTokenizer import BaseTokenizer
 
 
@@ -16,7 +16,7 @@ class VectorTokenizer(BaseTokenizer):
         self.vector_size = vector_size
 
         np.random.seed(random_seed)
-        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), vector_size])
+        self.random_vecs = np.random.normal(size=[math.ceil(math.log(num_embeddings, 2)), vector_size]).astype(np.float32)
 
     def __call__(self, vectors: np.ndarray):
         """
@@ -26,10 +26,10 @@ class VectorTokenizer(BaseTokenizer):
         return self.numerize(vectors)
 
     def numerize(self, vectors):
-        binary_vecs = (vectors @ self.random_vecs.T > 0).astype(int)
-        numbers = [int(array2str(vector), 2) % self.num_embeddings for vector in binary_vecs]
-        numbers = [max(number, self.padding_idx + 1) for number in numbers]
-        return  np.array(numbers)
+        numbers = binary2number(vectors.astype(np.float32, copy=False) @ self.random_vecs.T > 0)
+        np.remainder(numbers, self.num_embeddings, out=numbers)
+        np.maximum(numbers, self.padding_idx + 1, out=numbers)
+        return numbers
 
     def tokenize(self):
         pass
\ No newline at end of file
@@ -1,4 +1,4 @@
-from nltk import word_tokenize
+from typing import Callable
 
 from .BaseTokenizer import CorpusBasedTokenizer
 
@@ -8,10 +8,11 @@ class WordTokenizer(CorpusBasedTokenizer):
                  local_dir: str="word_tokenizer",
                  num_embeddings: int=None, 
                  padding_idx: int=0,
-                 input_word: bool=False):
+                 input_word: bool=False,
+                 word_tokenizer: Callable=None):
 
-        super().__init__(local_dir, num_embeddings, padding_idx, input_word)
+        super().__init__(local_dir, num_embeddings, padding_idx, input_word, word_tokenizer)
 
     def tokenize(self, string: str):
         """ Convert a given string into a sequence of tokens """
-        return word_tokenize(string) if not self.input_word else [string]
\ No newline at end of file
+        return self.word_tokenizer(string) if not self.input_word else [string]
\ No newline at end of file
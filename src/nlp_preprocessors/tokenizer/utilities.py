@@ -1,4 +1,5 @@
 import math
+import regex
 import hashlib
 import numpy as np
 
@@ -7,37 +8,85 @@ from pythainlp.tokenize import syllable_tokenize
 from nltk.tokenize import LegalitySyllableTokenizer
 
 
+# Combining marks (\p{M}) are kept inside words so Thai, Devanagari and NFD text are not split apart
+word_pattern = regex.compile(r"[\w\p{M}]+|[^\w\p{M}\s]")
+
+
+def word_tokenize(string):
+    return word_pattern.findall(string)
+
+
+def iter_grams(word, ngrams=(3, 4, 5, 6), skipngrams=(2, 3)):
+    for n in ngrams:
+        for i in range(len(word) - n + 1):
+            yield word[i:i + n]
+    for n in skipngrams:
+        for i in range(len(word) - 2 * n + 2):
+            yield word[i:i + 2 * n - 1:2]
+
+
 def word2ngram(word, n=3):
-    grams = [word[i:i+n] for i in range(len(word) - n + 1)]
+    grams = list(iter_grams(word, ngrams=(n, ), skipngrams=()))
     return grams
 
 
 def word2skipngram(word, n=2):
-    skipgrams = ["".join([word[i+(j*2)] for j in range(n)]) for i in range(len(word) - 2 * n + 2)]
+    skipgrams = list(iter_grams(word, ngrams=(), skipngrams=(n, )))
     return skipgrams
 
 
+def word2grams(word, ngrams=(3, 4, 5, 6), skipngrams=(2, 3)):
+    grams = list(iter_grams(word, ngrams, skipngrams))
+    return grams
+
+
 def shorten_signal(signal, threshold=1e-3, offset=100):
-    start_id = 0
-    for i in np.arange(signal.shape[0]):
-        value = signal[i]
-        if abs(value) > threshold:
-            start_id = i
-            break
-
-    end_id = math.inf
-    for i in np.arange(signal.shape[0])[::-1]:
-        value = signal[i]
-        if abs(value) > threshold:
-            end_id = i
-            break
-            
-    signal = signal[start_id - offset:end_id + offset]
+    indices = np.flatnonzero(np.abs(signal) > threshold)
+    if indices.size == 0:
+        return signal
+
+    signal = signal[max(indices[0] - offset, 0):indices[-1] + offset]
     return signal
 
 
-def array2str(array):
-    return str(array).replace("[", "").replace("]", "").replace(" ", "")
+def binary2number(binary_vecs):
+    k = binary_vecs.shape[-1]
+    assert k <= 63, "Binary vectors longer than 63 bits do not fit in int64"
+
+    # Left-pad bits to one byte (k <= 8) or one big-endian uint64 and pack them in one pass
+    num_bytes = 1 if k <= 8 else 8
+    bits = np.zeros(binary_vecs.shape[:-1] + (num_bytes * 8, ), dtype=bool)
+    bits[..., num_bytes * 8 - k:] = binary_vecs
+    packed = np.packbits(bits.ravel())
+    if num_bytes == 8:
+        packed = packed.view(">u8")
+    numbers = packed.reshape(binary_vecs.shape[:-1]).astype(np.int64)
+    return numbers
+
+
+def numerize_windows(blocks, numerize, chunk_size=2 ** 22):
+    # Copy blocks of windows (num_windows, *window_shape) into a reused float32 buffer of at most chunk_size values
+    # and numerize it chunk by chunk, so peak memory does not grow with the number of windows
+    window_shape = blocks[0].shape[1:]
+    total = sum(block.shape[0] for block in blocks)
+    numbers = np.empty([total], dtype=np.int64)
+    buffer = np.empty([min(max(chunk_size // math.prod(window_shape), 1), total), *window_shape], dtype=np.float32)
+
+    start = filled = 0
+    for block in blocks:
+        i = 0
+        while i < block.shape[0]:
+            n = min(block.shape[0] - i, buffer.shape[0] - filled)
+            buffer[filled:filled + n] = block[i:i + n]
+            filled += n
+            i += n
+            if filled == buffer.shape[0]:
+                numbers[start:start + filled] = numerize(buffer)
+                start += filled
+                filled = 0
+    if filled > 0:
+        numbers[start:start + filled] = numerize(buffer[:filled])
+    return numbers
 
 
 class Word2Syllable:
@@ -60,6 +109,8 @@ class LocalitySensitiveHashing:
     def __init__(self, k, random_seed=0):
         self.k = k
         self.random_seed = random_seed
+        # Row order of the min-hash permutation, drawn from a private RandomState so calls are thread-safe
+        self.row_order = np.argsort(np.random.RandomState(random_seed).permutation(k))
         
     def __call__(self, string):
         ids = [int(hashlib.sha3_224(bytes(char, "utf8")).hexdigest(), 16) % self.k for char in string]
@@ -70,11 +121,7 @@ class LocalitySensitiveHashing:
     def minhashing(self, ids):
         binary_vector = self.get_binary_vector(ids)
         
-        row_indices = np.arange(self.k)
-        np.random.seed(self.random_seed)
-        np.random.shuffle(row_indices)
-        for row in range(self.k):
-            idx = np.where(row_indices == row)[0][0]
+        for idx in self.row_order:
             val = binary_vector[idx]
             if val == 1:
                 min_id = idx